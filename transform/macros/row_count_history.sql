@@ -0,0 +1,42 @@
+{% macro row_count_history_relation() %}
+    {{ return(api.Relation.create(database=target.database, schema=target.schema, identifier='row_count_history')) }}
+{% endmacro %}
+
+
+{% macro create_row_count_history() %}
+    create table if not exists {{ row_count_history_relation() }} (
+        model_name varchar
+        , row_count bigint
+        , recorded_at timestamp
+    )
+{% endmacro %}
+
+
+-- post-hook: keeps one row per build so the column_quality test can compare against the previous build
+{% macro record_row_count() %}
+    insert into {{ row_count_history_relation() }}
+    select
+
+        '{{ this.identifier }}' as model_name
+        , count(*) as row_count
+        , current_timestamp as recorded_at
+
+    from {{ this }}
+{% endmacro %}
+
+
+-- post-hook: row_count_history lives in the committed .duckdb file, so only the latest builds per model are kept
+{% macro trim_row_count_history(keep_builds=10) %}
+    delete from {{ row_count_history_relation() }}
+    where model_name = '{{ this.identifier }}'
+        and recorded_at < (
+            select min(recorded_at)
+            from (
+                select recorded_at
+                from {{ row_count_history_relation() }}
+                where model_name = '{{ this.identifier }}'
+                order by recorded_at desc
+                limit {{ keep_builds }}
+            )
+        )
+{% endmacro %}
@@ -0,0 +1,81 @@
+-- Runs every column-level check for a model in a single table scan, instead of one scan per not_null test.
+-- Returns one row per failing check with the failure count and a handful of sample rows,
+-- so `dbt test --store-failures` leaves a per-column breakdown behind. The CLI reports the total number of failing rows.
+{% test column_quality(model, not_null=[], ranges={}, max_row_count_change=none, sample_size=5) %}
+
+{{ config(fail_calc='coalesce(sum(failures), 0)') }}
+
+{%- set checks = [] -%}
+{%- for column in not_null -%}
+    {%- do checks.append({'name': 'not_null', 'column': column, 'condition': column ~ ' is null'}) -%}
+{%- endfor -%}
+{%- for column, bounds in ranges.items() -%}
+    {%- set conditions = [] -%}
+    {%- if bounds.get('min_value') is not none -%}
+        {%- do conditions.append(column ~ ' < ' ~ bounds.get('min_value')) -%}
+    {%- endif -%}
+    {%- if bounds.get('max_value') is not none -%}
+        {%- do conditions.append(column ~ ' > ' ~ bounds.get('max_value')) -%}
+    {%- endif -%}
+    {%- if not conditions -%}
+        {{ exceptions.raise_compiler_error("column_quality: range for '" ~ column ~ "' needs a min_value and/or max_value") }}
+    {%- endif -%}
+    {%- do checks.append({'name': 'accepted_range', 'column': column, 'condition': conditions | join(' or ')}) -%}
+{%- endfor -%}
+
+with aggregated as (
+
+    select
+
+        count(*) as row_count
+        {%- for check in checks %}
+        , count(*) filter (where {{ check.condition }}) as check_{{ loop.index }}_failures
+        , min_by(model_rows, hash(model_rows), {{ sample_size }}) filter (where {{ check.condition }}) as check_{{ loop.index }}_samples
+        {%- endfor %}
+
+    from {{ model }} as model_rows
+
+), previous_build as (
+
+    select row_count
+    from {{ row_count_history_relation() }}
+    where model_name = '{{ model.identifier }}'
+    order by recorded_at desc
+    -- the newest row is the build under test, written by its record_row_count post-hook
+    limit 1 offset 1
+
+), final as (
+
+    select
+
+        unnest([
+            {%- for check in checks %}
+            {
+                'check_name': '{{ check.name }}'
+                , 'column_name': '{{ check.column }}'
+                , 'failures': check_{{ loop.index }}_failures
+                , 'detail': '{{ check.condition }}'
+                , 'sample_rows': check_{{ loop.index }}_samples
+            },
+            {%- endfor %}
+            {%- if max_row_count_change is not none %}
+            {
+                'check_name': 'row_count_delta'
+                , 'column_name': null
+                , 'failures': if(abs(aggregated.row_count - previous_build.row_count) > {{ max_row_count_change }} * previous_build.row_count, 1, 0)
+                , 'detail': 'previous build ' || previous_build.row_count || ' rows, current build ' || aggregated.row_count || ' rows'
+                , 'sample_rows': null
+            },
+            {%- endif %}
+        ], recursive := true)
+
+    from aggregated
+    left join previous_build
+        on true
+
+)
+
+select * from final
+where failures > 0
+
+{% endtest %}
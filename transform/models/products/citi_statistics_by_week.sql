@@ -1,4 +1,4 @@
-{{ config(materialized='table') }}
+{{ config(materialized='table', post_hook=["{{ record_row_count() }}", "{{ trim_row_count_history() }}"]) }}
 
 with rides as (
     select * from {{ ref('fact_citi_rides') }}